@@ -12,6 +12,7 @@ import asyncio
 import json
 import logging
 import threading
+import time
 from typing import Any, Callable, Dict, List, Optional
 
 import websockets
@@ -47,6 +48,10 @@ class GameClient:
         self.running = False
         self.connected = False
 
+        # Events so synchronous callers can block until something happens instead of sleeping
+        self.connected_event = threading.Event()
+        self.message_event = threading.Event()
+
         # Initialize a local copy of the game state
         self.game = None
 
@@ -119,6 +124,7 @@ class GameClient:
         try:
             self.websocket = await websockets.connect(f"ws://{self.host}:{self.port}")
             self.connected = True
+            self.connected_event.set()
             logger.info("Connected to server")
             return True
         except Exception as e:
@@ -130,6 +136,7 @@ class GameClient:
         if self.websocket and self.connected:
             await self.websocket.close()
             self.connected = False
+            self.connected_event.clear()
             logger.info("Disconnected from server")
 
     def _deserialize_game_state(self, state_data: Dict[str, Any]) -> GameEngine:
@@ -329,12 +336,15 @@ class GameClient:
         try:
             async for message in self.websocket:
                 await self._process_message(message)
+                self.message_event.set()
         except ConnectionClosed:
             logger.info("Connection to server closed")
             self.connected = False
+            self.connected_event.clear()
         except Exception as e:
             logger.error(f"Error receiving messages: {e}")
             self.connected = False
+            self.connected_event.clear()
 
     async def _client_loop(self) -> None:
         """Main client loop for connecting and receiving messages."""
@@ -785,11 +795,35 @@ def set_player_info_sync(client: GameClient, player_name: str, player_color: str
         loop.close()
 
 
+def wait_for_replies(client: GameClient, timeout: float = 0.5, quiet_gap: float = 0.1) -> None:
+    """
+    Wait for the server's reply to a command to finish arriving.
+
+    One command can produce several messages back to back (e.g. a move_result followed by
+    a game_state broadcast), so after the first message keep waiting until no new message
+    has arrived for quiet_gap seconds, and never longer than timeout in total.
+
+    Args:
+        client: GameClient instance
+        timeout: Maximum time to wait in seconds (default 0.5)
+        quiet_gap: Silence after which the reply is considered complete (default 0.1)
+    """
+    deadline = time.monotonic() + timeout
+    if not client.message_event.wait(timeout=timeout):
+        return
+
+    while True:
+        client.message_event.clear()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not client.message_event.wait(timeout=min(quiet_gap, remaining)):
+            return
+
+
 def main():
     """Run a simple test client."""
     import argparse
     import random
-    import time
+    import sys
 
     parser = argparse.ArgumentParser(description="GPT Generals Game Client")
     parser.add_argument("--host", default="localhost", help="Server host address")
@@ -812,15 +846,19 @@ def main():
 
     # Register callbacks for game state
     def on_state_update(game):
-        print("\nGame state updated:")
-        print(game.render_map())
-        print(f"Turn: {game.current_turn}")
-
         # Display units with positions
         units_str = ", ".join([f"{name} at {unit.position}" for name, unit in game.units.items()])
-        print(f"Units: {units_str}")
 
-        print(f"Coins: {len(game.coin_positions)}")
+        # Emit the whole update with a single write
+        lines = [
+            "\nGame state updated:",
+            game.render_map(),
+            f"Turn: {game.current_turn}",
+            f"Units: {units_str}",
+            f"Coins: {len(game.coin_positions)}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def on_move_result(result):
         success = result.get("success", False)
@@ -864,7 +902,8 @@ def main():
     try:
         # Wait for connection
         print("Connecting to server...")
-        time.sleep(2)
+        if not client.connected_event.wait(timeout=5):
+            print("Could not connect to server.")
 
         # Determine if we should skip the lobby
         if args.no_lobby:
@@ -907,6 +946,7 @@ def main():
             while client.running and client.connected and not game_running:
                 show_lobby_menu()
                 choice = input("\nEnter your choice (1-7): ").strip()
+                client.message_event.clear()
 
                 if choice == "1":
                     print("Refreshing lobby state...")
@@ -1015,8 +1055,8 @@ def main():
                 else:
                     print("Invalid choice. Please try again.")
 
-                # Short delay to allow for responses from server
-                time.sleep(0.5)
+                # Give the server a moment to respond, returning once its reply is complete
+                wait_for_replies(client)
 
         # Game loop - only enter if we're now in a game
         if game_running and client.running and client.connected:
@@ -1030,6 +1070,7 @@ def main():
                     .lower()
                     .strip()
                 )
+                client.message_event.clear()
 
                 if command == "quit":
                     break
@@ -1051,8 +1092,8 @@ def main():
                 else:
                     print("Unknown command")
 
-                # Short delay to allow for response
-                time.sleep(0.5)
+                # Give the server a moment to respond, returning once its reply is complete
+                wait_for_replies(client)
 
     except KeyboardInterrupt:
         print("\nExiting...")
@@ -76,6 +76,13 @@ class GameEngine:
         self.height = len(self.map_grid)
         self.width = len(self.map_grid[0]) if self.height > 0 else 0
 
+        # Terrain never changes after creation, so cache its display rows once
+        self.terrain_rows = MapGenerator.to_terrain_rows(self.map_grid)
+
+        # Last rendered map and the unit/coin positions it was drawn from
+        self._render_key: Optional[tuple] = None
+        self._rendered_map = ""
+
         # Initialize empty collections for players, units and coins
         self.players: Dict[str, Player] = {}
         self.units: Dict[str, Unit] = {}
@@ -224,6 +231,26 @@ class GameEngine:
 
         return True
 
+    def get_legal_moves(self, unit_name: str) -> List[str]:
+        """
+        Get the directions a unit can currently move in.
+
+        Args:
+            unit_name: Name of the unit to check
+
+        Returns:
+            The directions ('up', 'down', 'left', 'right') that lead to a land tile on the map
+        """
+        x, y = self.units[unit_name].position
+        targets = (("up", x, y + 1), ("down", x, y - 1), ("left", x - 1, y), ("right", x + 1, y))
+        return [
+            direction
+            for direction, new_x, new_y in targets
+            if 0 <= new_x < self.width
+            and 0 <= new_y < self.height
+            and self.map_grid[new_y][new_x] == TerrainType.LAND
+        ]
+
     def next_turn(self):
         """Advance to the next turn and save the game state."""
         self.current_turn += 1
@@ -239,14 +266,19 @@ class GameEngine:
         # Convert units to position dictionary for MapGenerator.render_map
         unit_positions = {unit.name: unit.position for unit in self.units.values()}
 
-        # Get unit colors based on player
-        unit_colors = {
-            unit.name: self.players[unit.player_id].color for unit in self.units.values()
-        }
+        # The map is rendered several times per turn (once per unit prompt), so reuse the
+        # last render while no unit has moved and no coin has been collected
+        render_key = (tuple(unit_positions.items()), tuple(self.coin_positions))
+        if render_key == self._render_key:
+            return self._rendered_map
 
-        return MapGenerator.render_map(
-            self.map_grid, unit_positions, self.coin_positions, unit_colors
+        # Unit colors are only shown by the frontend, so the text render skips
+        # looking up each unit's player color
+        self._rendered_map = MapGenerator.render_map(
+            self.map_grid, unit_positions, self.coin_positions, terrain_rows=self.terrain_rows
         )
+        self._render_key = render_key
+        return self._rendered_map
 
 
 if __name__ == "__main__":
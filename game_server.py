@@ -117,6 +117,8 @@ class GameServer:
         # Server state
         self.server_running = False
         self.server_task: Optional[asyncio.Task] = None
+        self.server_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stop_event: Optional[asyncio.Event] = None
         self.server_thread: Optional[threading.Thread] = None
 
         # Game rooms for lobby
@@ -1013,21 +1015,34 @@ class GameServer:
             # Unregister the client when the connection is closed
             await self.unregister(websocket)
 
-    async def start_server(self) -> None:
-        """Start the WebSocket server."""
+    async def start_server(self, ready_event: Optional[threading.Event] = None) -> None:
+        """
+        Start the WebSocket server.
+
+        Args:
+            ready_event: Optional event to set once the server is listening
+        """
         self.server_running = True
+        self.server_loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
         logger.info(f"Starting server on {self.host}:{self.port}")
 
         # Start the server
         async with websockets.serve(self.handler, self.host, self.port):
-            # Set up signal handlers for graceful shutdown
-            loop = asyncio.get_running_loop()
-            loop.add_signal_handler(signal.SIGINT, lambda: asyncio.create_task(self.shutdown()))
-            loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(self.shutdown()))
+            # Set up signal handlers for graceful shutdown (only possible on the main thread)
+            if threading.current_thread() is threading.main_thread():
+                loop = asyncio.get_running_loop()
+                loop.add_signal_handler(signal.SIGINT, lambda: asyncio.create_task(self.shutdown()))
+                loop.add_signal_handler(
+                    signal.SIGTERM, lambda: asyncio.create_task(self.shutdown())
+                )
+
+            # Let anyone waiting on startup know the socket is bound
+            if ready_event is not None:
+                ready_event.set()
 
-            # Keep the server running
-            while self.server_running:
-                await asyncio.sleep(1)
+            # Keep the server running until shutdown() or stop() wakes us
+            await self.stop_event.wait()
 
     async def shutdown(self) -> None:
         """Shutdown the server gracefully."""
@@ -1039,8 +1054,16 @@ class GameServer:
             await asyncio.gather(*[client.close() for client in self.clients])
             self.clients.clear()
 
-    def start(self) -> None:
-        """Start the server in a separate thread."""
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def start(self, ready_event: Optional[threading.Event] = None) -> None:
+        """
+        Start the server in a separate thread.
+
+        Args:
+            ready_event: Optional event to set once the server is listening
+        """
         if self.server_thread is not None and self.server_thread.is_alive():
             logger.warning("Server is already running")
             return
@@ -1049,7 +1072,7 @@ class GameServer:
         def run_server():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            self.server_task = loop.create_task(self.start_server())
+            self.server_task = loop.create_task(self.start_server(ready_event))
             try:
                 loop.run_until_complete(self.server_task)
             except asyncio.CancelledError:
@@ -1068,8 +1091,10 @@ class GameServer:
             logger.warning("Server is not running")
             return
 
-        # Set server_running to False
+        # Set server_running to False and wake the server loop so it exits right away
         self.server_running = False
+        if self.server_loop is not None and self.stop_event is not None:
+            self.server_loop.call_soon_threadsafe(self.stop_event.set)
 
         # Join the thread
         if self.server_thread is not None:
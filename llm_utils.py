@@ -15,6 +15,29 @@ load_dotenv()
 # Define logs directory
 LOGS_DIR = Path("logs/llm_calls")
 
+# Shared OpenRouter client, created on first use so its connection pool is reused across calls
+_client: Optional[OpenAI] = None
+
+
+def _get_client() -> OpenAI:
+    """
+    Get the shared OpenRouter client, creating it on first use.
+
+    Raises:
+        ValueError: If OPEN_ROUTER_KEY environment variable is not set
+    """
+    global _client
+    if _client is None:
+        api_key = os.getenv("OPEN_ROUTER_KEY")
+        if not api_key:
+            raise ValueError("OPEN_ROUTER_KEY environment variable must be set")
+
+        _client = OpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+        )
+    return _client
+
 
 def ensure_logs_directory() -> None:
     """Ensure the logs directory exists."""
@@ -32,13 +55,14 @@ def log_model_call(model: str, messages: List[ChatCompletionMessageParam], respo
     """
     ensure_logs_directory()
 
-    # Create a timestamp for the log filename
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    # Read the clock once so the filename and the header record the same moment
+    now = datetime.datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S_%f")
     log_file = LOGS_DIR / f"{timestamp}_{model.replace('/', '-')}.txt"
 
     with open(log_file, "w", encoding="utf-8") as f:
         f.write(f"Model: {model}\n")
-        f.write(f"Timestamp: {datetime.datetime.now().isoformat()}\n\n")
+        f.write(f"Timestamp: {now.isoformat()}\n\n")
 
         f.write("=== INPUT ===\n")
         for msg in messages:
@@ -104,14 +128,7 @@ def call_openrouter(
     Raises:
         ValueError: If OPEN_ROUTER_KEY environment variable is not set or if response has no content
     """
-    api_key = os.getenv("OPEN_ROUTER_KEY")
-    if not api_key:
-        raise ValueError("OPEN_ROUTER_KEY environment variable must be set")
-
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    client = _get_client()
 
     openai_messages = messages.to_openai_messages()
 
@@ -147,14 +164,7 @@ def call_openrouter_structured(
     Raises:
         ValueError: If OPEN_ROUTER_KEY environment variable is not set or if response has no content
     """
-    api_key = os.getenv("OPEN_ROUTER_KEY")
-    if not api_key:
-        raise ValueError("OPEN_ROUTER_KEY environment variable must be set")
-
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    client = _get_client()
 
     openai_messages = messages.to_openai_messages()
 
@@ -1,5 +1,6 @@
 import random
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 
@@ -8,6 +9,20 @@ class TerrainType(Enum):
     WATER = "~"
 
 
+# Display character for each terrain type, so rendering avoids Enum .value lookups
+TERRAIN_CHARS = {terrain: terrain.value for terrain in TerrainType}
+
+
+# Line break and row-number label that start each map row, indexed by y % 10
+_ROW_PREFIXES = tuple(b"\n%d " % digit for digit in range(10))
+
+
+@lru_cache(maxsize=16)
+def _column_header(width: int) -> bytes:
+    """Build the column-number header row for a map of the given width."""
+    return b"  " + "".join([str(i % 10) for i in range(width)]).encode("ascii")
+
+
 class MapGenerator:
     """Class responsible for generating game maps with different terrains."""
 
@@ -51,6 +66,19 @@ class MapGenerator:
         """
         return [[TerrainType.LAND for _ in range(width)] for _ in range(height)]
 
+    @staticmethod
+    def to_terrain_rows(map_grid: List[List[TerrainType]]) -> List[bytes]:
+        """
+        Convert a map to rows of display characters.
+
+        Args:
+            map_grid: The map to convert
+
+        Returns:
+            One ASCII bytes object per row ("." for land, "~" for water)
+        """
+        return ["".join([TERRAIN_CHARS[cell] for cell in row]).encode("ascii") for row in map_grid]
+
     @staticmethod
     def find_random_land_positions(
         map_grid: List[List[TerrainType]],
@@ -68,25 +96,41 @@ class MapGenerator:
         Returns:
             List of (x, y) tuples representing land positions
         """
-        if excluded_positions is None:
-            excluded_positions = []
+        excluded = set(excluded_positions) if excluded_positions else set()
 
         width = len(map_grid[0])
         height = len(map_grid)
 
-        # Get all available land positions
-        all_land_positions = []
-        for y in range(height):
-            for x in range(width):
-                if map_grid[y][x] == TerrainType.LAND and (x, y) not in excluded_positions:
-                    all_land_positions.append((x, y))
+        # Draw random cells and keep the free land ones; for the usual small counts this
+        # finds every position without building a list of the whole map
+        positions: List[Tuple[int, int]] = []
+        attempts = 4 * count + 16
+        while len(positions) < count and attempts > 0:
+            attempts -= 1
+            x = random.randrange(width)
+            y = random.randrange(height)
+            if map_grid[y][x] == TerrainType.LAND and (x, y) not in excluded:
+                excluded.add((x, y))
+                positions.append((x, y))
+
+        if len(positions) == count:
+            return positions
+
+        # Too many misses (mostly water or mostly taken), so fall back to a full scan
+        remaining_land_positions = [
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if map_grid[y][x] == TerrainType.LAND and (x, y) not in excluded
+        ]
 
         # Make sure we have enough land positions
-        if len(all_land_positions) < count:
-            return all_land_positions
+        needed = count - len(positions)
+        if len(remaining_land_positions) < needed:
+            return positions + remaining_land_positions
 
-        # Randomly select 'count' positions
-        return random.sample(all_land_positions, count)
+        # Randomly select the rest of the positions
+        return positions + random.sample(remaining_land_positions, needed)
 
     @staticmethod
     def render_map(
@@ -94,15 +138,19 @@ class MapGenerator:
         unit_positions: Optional[dict] = None,
         coin_positions: Optional[List[Tuple[int, int]]] = None,
         unit_colors: Optional[dict] = None,
+        terrain_rows: Optional[List[bytes]] = None,
     ) -> str:
         """
         Render a map as a string with optional units and coins.
 
+        Each unit is drawn using its (single-character) name.
+
         Args:
             map_grid: The map to render
             unit_positions: Dict mapping unit names to (x, y) positions (default None)
             coin_positions: List of (x, y) tuples for coin positions (default None)
             unit_colors: Dict mapping unit names to color codes (default None)
+            terrain_rows: Precomputed to_terrain_rows(map_grid) (default None)
 
         Returns:
             A string representation of the map
@@ -113,39 +161,38 @@ class MapGenerator:
             coin_positions = []
         if unit_colors is None:
             unit_colors = {}
+        if terrain_rows is None:
+            terrain_rows = MapGenerator.to_terrain_rows(map_grid)
 
         width = len(map_grid[0])
         height = len(map_grid)
-        result = []
 
-        # Add a header with column numbers
-        header = "  " + "".join(f"{i % 10}" for i in range(width))
-        result.append(header)
+        # Add a header with column numbers; the whole map is written into this one buffer
+        result = bytearray(_column_header(width))
 
-        # Render map grid in reverse order (start from the highest row number)
+        # Render map grid in reverse order (start from the highest row number), remembering
+        # where each row's cells start so units and coins can be written straight in
+        row_starts = [0] * height
         for y in range(height - 1, -1, -1):
             # Add row number at the beginning of each row
-            row = f"{y % 10} "
-
-            for x in range(width):
-                # Check if there's a unit at this position
-                unit_at_pos = None
-                for name, pos in unit_positions.items():
-                    if pos == (x, y):
-                        unit_at_pos = name
-                        break
-
-                if unit_at_pos:
-                    # This is just for terminal output, colors will be displayed in the frontend
-                    row += unit_at_pos
-                elif (x, y) in coin_positions:
-                    row += "c"
-                else:
-                    row += map_grid[y][x].value
-
-            result.append(row)
-
-        return "\n".join(result)
+            result += _ROW_PREFIXES[y % 10]
+            row_starts[y] = len(result)
+            result += terrain_rows[y]
+
+        # Only the cells holding a coin or a unit differ from the terrain. Coins go first so
+        # units are drawn over them, and units are written last-to-first so the first unit
+        # listed wins if two units share a tile.
+        coin_byte = ord("c")
+        for x, y in coin_positions:
+            if 0 <= x < width and 0 <= y < height:
+                result[row_starts[y] + x] = coin_byte
+
+        # This is just for terminal output, colors will be displayed in the frontend
+        for name, (x, y) in reversed(unit_positions.items()):
+            if 0 <= x < width and 0 <= y < height:
+                result[row_starts[y] + x] = ord(name)
+
+        return result.decode("latin-1")
 
 
 if __name__ == "__main__":
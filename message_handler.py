@@ -5,7 +5,11 @@ This module provides a ChatMessage class and ChatHistory class to manage chat me
 for natural language interaction with units.
 """
 
-from typing import List, Optional, Tuple, Union
+from io import StringIO
+from typing import List, Optional, Sequence, Tuple, Union
+
+# Display prefixes for the fixed sender names; anything else is a unit
+_PREFIXES = {"system": "SYSTEM: ", "player": "YOU: ", "move": "MOVE: "}
 
 
 class ChatMessage:
@@ -34,21 +38,34 @@ class ChatHistory:
 
     def __init__(self):
         """Initialize an empty chat history."""
-        # Store messages as ChatMessage objects or (sender, content) tuples
-        # for backward compatibility
-        self.messages: List[Union[ChatMessage, Tuple[str, str]]] = []
+        # Store messages as ChatMessage objects only; legacy (sender, content)
+        # tuples are converted when they are added
+        self.messages: List[ChatMessage] = []
+
+        # Display lines for self.messages, formatted once as each message is added
+        self._formatted_lines: List[str] = []
+
+        # Bumped on every add so formatted output can be reused until something changes
+        self._version = 0
+        self._format_cache: Tuple[int, Optional[int], str] = (-1, None, "")
 
         # Add a welcome message
         self.add_system_message("Welcome to GPT Generals! Type your commands to control units.")
 
-    def add_message(self, message: ChatMessage) -> None:
+    def add_message(self, message: Union[ChatMessage, Tuple[str, str]]) -> None:
         """
-        Add a ChatMessage object to the chat history.
+        Add a message to the chat history.
 
         Args:
-            message: The ChatMessage object to add
+            message: The ChatMessage object to add, or a legacy (sender, content) tuple
         """
+        if isinstance(message, tuple):
+            sender, content = message
+            sender_type = sender if sender in _PREFIXES else "unit"
+            message = ChatMessage(sender, content, sender_type)
         self.messages.append(message)
+        self._formatted_lines.append(self.format_message(message))
+        self._version += 1
 
     def add_player_message(self, content: str) -> None:
         """
@@ -57,7 +74,7 @@ class ChatHistory:
         Args:
             content: The message content
         """
-        self.messages.append(ChatMessage("player", content, "player"))
+        self.add_message(ChatMessage("player", content, "player"))
 
     def add_unit_message(self, unit_name: str, content: str) -> None:
         """
@@ -67,7 +84,7 @@ class ChatHistory:
             unit_name: The name of the unit sending the message
             content: The message content
         """
-        self.messages.append(ChatMessage(unit_name, content, "unit"))
+        self.add_message(ChatMessage(unit_name, content, "unit"))
 
     def add_system_message(self, content: str) -> None:
         """
@@ -76,7 +93,7 @@ class ChatHistory:
         Args:
             content: The message content
         """
-        self.messages.append(ChatMessage("system", content, "system"))
+        self.add_message(ChatMessage("system", content, "system"))
 
     def add_move_message(self, content: str) -> None:
         """
@@ -85,9 +102,9 @@ class ChatHistory:
         Args:
             content: The message content describing the movement
         """
-        self.messages.append(ChatMessage("move", content, "move"))
+        self.add_message(ChatMessage("move", content, "move"))
 
-    def get_last_n_messages(self, n: int) -> List[Union[ChatMessage, Tuple[str, str]]]:
+    def get_last_n_messages(self, n: int) -> Sequence[ChatMessage]:
         """
         Get the last n messages from the chat history.
 
@@ -95,59 +112,70 @@ class ChatHistory:
             n: Number of messages to retrieve
 
         Returns:
-            List of ChatMessage objects or (sender, content) tuples
+            Read-only sequence of ChatMessage objects (not a copy when n covers the history)
         """
-        return self.messages[-n:] if n < len(self.messages) else self.messages[:]
+        return self.messages[-n:] if n < len(self.messages) else self.messages
 
-    def get_all_messages(self) -> List[Union[ChatMessage, Tuple[str, str]]]:
+    def get_all_messages(self) -> Sequence[ChatMessage]:
         """
         Get all messages from the chat history.
 
         Returns:
-            List of ChatMessage objects or (sender, content) tuples
+            Read-only view of the stored ChatMessage objects (not a copy)
         """
-        return self.messages[:]
+        return self.messages
 
-    def format_message(self, message: Union[ChatMessage, Tuple[str, str]]) -> str:
+    def format_message(self, message: ChatMessage) -> str:
         """
         Format a message for display.
 
         Args:
-            message: A ChatMessage object or (sender, content) tuple
+            message: The ChatMessage object to format
 
         Returns:
             Formatted message string
         """
-        if isinstance(message, ChatMessage):
-            sender = message.sender
-            content = message.content
-        else:
-            sender, content = message
+        prefix = _PREFIXES.get(message.sender)
+        if prefix is None:
+            prefix = f"UNIT {message.sender}: "
+        return prefix + message.content
 
-        if sender == "system":
-            return f"SYSTEM: {content}"
-        elif sender == "player":
-            return f"YOU: {content}"
-        elif sender == "move":
-            return f"MOVE: {content}"
-        else:
-            return f"UNIT {sender}: {content}"
+    def get_formatted_lines(self, max_messages: Optional[int] = None) -> Sequence[str]:
+        """
+        Get the formatted display lines of the chat history.
 
-    def format_chat_history(self, max_messages: Optional[int] = None) -> str:
+        Args:
+            max_messages: Maximum number of messages to include (from newest)
+
+        Returns:
+            Read-only sequence of formatted lines, one per message
+        """
+        # Use all messages by default, otherwise only the last max_messages
+        lines = self._formatted_lines
+        if max_messages is not None and max_messages < len(lines):
+            return lines[-max_messages:]
+        return lines
+
+    def format_chat_history(
+        self, max_messages: Optional[int] = None, buffer: Optional[StringIO] = None
+    ) -> str:
         """
         Format the chat history for display.
 
         Args:
             max_messages: Maximum number of messages to include (from newest)
+            buffer: Optional StringIO to stream the formatted lines into
 
         Returns:
             Formatted chat history as a string
         """
-        # Use all messages by default
-        if max_messages is None:
-            messages = self.messages
-        else:
-            # Only get the last max_messages
-            messages = self.get_last_n_messages(max_messages)
+        version, cached_max, text = self._format_cache
+        if version != self._version or cached_max != max_messages:
+            text = "\n".join(self.get_formatted_lines(max_messages))
+            self._format_cache = (self._version, max_messages, text)
+
+        if buffer is not None and text:
+            buffer.write(text)
+            buffer.write("\n")
 
-        return "\n".join(self.format_message(msg) for msg in messages)
+        return text
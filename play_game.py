@@ -8,7 +8,6 @@ or it can start either the server or client independently.
 
 import argparse
 import logging
-import time
 
 # Configure logging
 logging.basicConfig(
@@ -86,6 +85,8 @@ def run_integrated_mode(
         manual_mode: Whether to use manual control mode (default False)
         debug: Whether to enable debug logging
     """
+    import threading
+
     from game_engine import GameEngine
     from game_server import GameServer
 
@@ -108,12 +109,13 @@ def run_integrated_mode(
         port=port,
     )
 
-    # Start the server in a background thread
-    server.start()
-    logger.info(f"Server started on {host}:{port}")
-
-    # Give the server a moment to initialize
-    time.sleep(1)
+    # Start the server in a background thread and wait until it is listening
+    ready = threading.Event()
+    server.start(ready_event=ready)
+    if ready.wait(timeout=5.0):
+        logger.info(f"Server started on {host}:{port}")
+    else:
+        logger.warning(f"Server on {host}:{port} did not report ready within 5 seconds")
 
     try:
         # Start the text client
@@ -2,10 +2,55 @@
 Player controller module for the GPT Generals game.
 """
 
-from typing import Optional
+import logging
+import string
+from types import MappingProxyType
+from typing import Optional, Sequence
 
 from message_handler import ChatHistory
 
+logger = logging.getLogger(__name__)
+
+# Fixed validation messages, kept as constants so failures don't re-format them
+INVALID_FORMAT_MESSAGE = "Invalid input. Please use format: <unit_letter><direction>"
+INVALID_DIRECTION_MESSAGE = (
+    "Invalid direction. Please use w/k (up), a/h (left), s/j (down), d/l (right)"
+)
+
+# Read-only mapping from manual-mode direction keys to game directions
+DIRECTION_MAP = MappingProxyType(
+    {
+        "w": "up",
+        "a": "left",
+        "s": "down",
+        "d": "right",
+        "k": "up",  # vim-style up
+        "h": "left",  # vim-style left
+        "j": "down",  # vim-style down
+        "l": "right",  # vim-style right
+    }
+)
+
+# Unit name for each ASCII letter key. chr() returns CPython's cached one-character strings,
+# the same objects GameEngine uses as unit keys, so the units lookup matches by identity.
+_UNIT_NAME_FOR_KEY = MappingProxyType({c: chr(ord(c) & 0xDF) for c in string.ascii_letters})
+
+# Game directions in the order used by the direction lookup table below
+DIRECTION_NAMES = ("up", "left", "down", "right")
+_INVALID_DIRECTION = 255
+
+
+def _build_direction_lut() -> bytes:
+    """Map every byte value to an index into DIRECTION_NAMES, covering both letter cases."""
+    lut = bytearray([_INVALID_DIRECTION]) * 256
+    for key, direction in DIRECTION_MAP.items():
+        lut[ord(key)] = lut[ord(key.upper())] = DIRECTION_NAMES.index(direction)
+    return bytes(lut)
+
+
+# Indexed by a key's code point, so manual input never needs .lower() or a dict lookup
+_DIRECTION_LUT = _build_direction_lut()
+
 
 class PlayerController:
     """
@@ -24,16 +69,7 @@ class PlayerController:
         self.game_engine = game_engine
         self.manual_mode = manual_mode
         self.chat_history = ChatHistory()
-        self.direction_map = {
-            "w": "up",
-            "a": "left",
-            "s": "down",
-            "d": "right",
-            "k": "up",  # vim-style up
-            "h": "left",  # vim-style left
-            "j": "down",  # vim-style down
-            "l": "right",  # vim-style right
-        }
+        self.direction_map = DIRECTION_MAP
 
     def process_input(self, player_input: str) -> bool:
         """
@@ -46,11 +82,21 @@ class PlayerController:
         Returns:
             True if the input was valid and any action was successful, False otherwise
         """
-        # Check if we're in manual mode
-        if self.manual_mode:
-            return self._process_manual_input(player_input)
-        else:
-            return self._process_natural_language(player_input)
+        # Dispatch straight to the handler for the current mode
+        return self._dispatch(player_input)
+
+    @property
+    def manual_mode(self) -> bool:
+        """Whether the controller is in manual (unit/direction) input mode."""
+        return self._manual_mode
+
+    @manual_mode.setter
+    def manual_mode(self, manual_mode: bool) -> None:
+        # Bind the input handler once per mode change rather than branching on every input
+        self._manual_mode = manual_mode
+        self._dispatch = (
+            self._process_manual_input if manual_mode else self._process_natural_language
+        )
 
     def _process_manual_input(self, player_input: str) -> bool:
         """
@@ -65,42 +111,38 @@ class PlayerController:
         """
         # Validate input format
         if len(player_input) != 2:
-            print("Invalid input. Please use format: <unit_letter><direction>")
+            logger.warning(INVALID_FORMAT_MESSAGE)
             return False
 
-        unit_name = player_input[0].upper()
-        direction_key = player_input[1].lower()
+        unit_key = player_input[0]
+        unit_name = _UNIT_NAME_FOR_KEY.get(unit_key) or unit_key.upper()
+        direction_code = ord(player_input[1])
 
         # Check if unit exists
-        if unit_name not in self.game_engine.units:
-            units_list = list(self.game_engine.units.keys())
-            print(f"Unit '{unit_name}' not found. Available units: {units_list}")
+        unit = self.game_engine.units.get(unit_name)
+        if unit is None:
+            if logger.isEnabledFor(logging.WARNING):
+                units_list = list(self.game_engine.units.keys())
+                logger.warning(f"Unit '{unit_name}' not found. Available units: {units_list}")
             return False
 
-        # Check if direction is valid
-        if direction_key not in self.direction_map:
-            print("Invalid direction. Please use w/k (up), a/h (left), s/j (down), d/l (right)")
+        # Translate wasd to game directions, rejecting unknown keys
+        direction_index = (
+            _DIRECTION_LUT[direction_code] if direction_code < 256 else _INVALID_DIRECTION
+        )
+        if direction_index == _INVALID_DIRECTION:
+            logger.warning(INVALID_DIRECTION_MESSAGE)
             return False
+        direction = DIRECTION_NAMES[direction_index]
 
-        # Translate wasd to game directions
-        direction = self.direction_map[direction_key]
-
-        # Get the player's ID from the game engine based on the unit name
-        unit = self.game_engine.units.get(unit_name)
-        if unit:
-            # Check if the unit exists in the game
-            player_id = unit.player_id
-        else:
-            player_id = None
-
-        # Try to move the unit
-        success = self.game_engine.move_unit(unit_name, direction, player_id)
+        # Try to move the unit on behalf of the player who owns it
+        success = self.game_engine.move_unit(unit_name, direction, unit.player_id)
 
         if success:
             # Add a movement message to chat history
             self.chat_history.add_move_message(f"{unit_name} moved {direction}")
         else:
-            print(f"Move failed. Unit {unit_name} cannot move {direction}.")
+            logger.warning(f"Move failed. Unit {unit_name} cannot move {direction}.")
 
         return success
 
@@ -134,7 +176,7 @@ class PlayerController:
         mode_name = "manual" if self.manual_mode else "natural language"
         message = f"Switched to {mode_name} input mode."
         self.chat_history.add_system_message(message)
-        print(message)
+        logger.info(message)
 
     def get_chat_history(self, max_messages: Optional[int] = None):
         """
@@ -147,3 +189,15 @@ class PlayerController:
             Formatted chat history as a string
         """
         return self.chat_history.format_chat_history(max_messages)
+
+    def get_chat_history_lines(self, max_messages: Optional[int] = None) -> Sequence[str]:
+        """
+        Get chat history as formatted lines, without joining and re-splitting a string.
+
+        Args:
+            max_messages: Maximum number of messages to include
+
+        Returns:
+            Formatted chat history lines, oldest first
+        """
+        return self.chat_history.get_formatted_lines(max_messages)
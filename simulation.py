@@ -1,9 +1,20 @@
 import argparse
 import random
+import sys
+from typing import List
 
 from game_engine import GameEngine
 from map_generator import MapGenerator
-from unit_movement import get_unit_move_decision
+
+# Directions a unit can be told to move in
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered output lines to stdout in one call and empty the buffer."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
 
 
 def run_simulation(num_turns: int = 10, use_custom_map: bool = False, use_llm: bool = True):
@@ -29,50 +40,68 @@ def run_simulation(num_turns: int = 10, use_custom_map: bool = False, use_llm: b
     print(game.render_map())
     print("\n")
 
-    directions = ["up", "down", "left", "right"]
+    if use_llm:
+        # Only pull in the OpenAI/pydantic stack when the LLM is actually used
+        from unit_movement import get_all_unit_move_decisions
 
     mode = "LLM" if use_llm else "Random"
     print(f"Running simulation with {mode} movement mode for {num_turns} turns\n")
 
     for turn in range(1, num_turns + 1):
-        print(f"--- Turn {turn} ---")
+        # Buffer the turn's output and write it once, instead of a print per line
+        lines = [f"--- Turn {turn} ---"]
+
+        # Ask the LLM for every unit's move in one request, or draw all the random moves
+        if use_llm:
+            lines.append("Consulting LLM for all units...")
+            # Show progress before blocking on the request
+            _write_lines(lines)
+            decisions = get_all_unit_move_decisions(game)
+
+            # Debug information about raw response (can be commented out in production).
+            # Every LLM-decided unit shares the one batch response, so preview it once per
+            # turn; forced moves are decided locally and have no raw response.
+            raw_response = next(
+                (response.raw_response for response in decisions.values() if response.raw_response),
+                "",
+            )
+            if raw_response:
+                if len(raw_response) > 200:
+                    raw_preview = raw_response[:200] + "..."
+                else:
+                    raw_preview = raw_response
+                lines.append(f"Raw response preview: {raw_preview}")
+        else:
+            random_directions = iter(random.choices(DIRECTIONS, k=len(game.units)))
 
         # Move each unit
         for unit_name in game.units:
             if use_llm:
-                # Get move decision from LLM
-                print(f"Consulting LLM for unit {unit_name}...")
-                response = get_unit_move_decision(game, unit_name)
+                response = decisions.get(unit_name)
 
                 if response:
                     direction = response.decision.direction
-                    print(f"Unit {unit_name} reasoning: {response.decision.reasoning}")
-
-                    # Debug information about raw response (can be commented out in production)
-                    if len(response.raw_response) > 200:
-                        raw_preview = response.raw_response[:200] + "..."
-                    else:
-                        raw_preview = response.raw_response
-                    print(f"Raw response preview: {raw_preview}")
+                    lines.append(f"Unit {unit_name} reasoning: {response.decision.reasoning}")
                 else:
                     # Fall back to random if LLM fails
-                    direction = random.choice(directions)
-                    print(f"LLM failed, Unit {unit_name} choosing random direction.")
+                    direction = random.choice(DIRECTIONS)
+                    lines.append(f"LLM failed, Unit {unit_name} choosing random direction.")
             else:
                 # Use random movement
-                direction = random.choice(directions)
+                direction = next(random_directions)
 
             success = game.move_unit(unit_name, direction)
             result = "Success" if success else "Failed"
-            print(f"Unit {unit_name} attempts to move {direction}: {result}")
+            lines.append(f"Unit {unit_name} attempts to move {direction}: {result}")
 
         # Advance to next turn
         game.next_turn()
 
         # Display the updated map
-        print(f"\nMap after Turn {game.current_turn - 1}:")
-        print(game.render_map())
-        print("\n")
+        lines.append(f"\nMap after Turn {game.current_turn - 1}:")
+        lines.append(game.render_map())
+        lines.append("\n")
+        _write_lines(lines)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ This example doesn't require game state and is easier to understand.
 
 import os
 import sys
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, cast
 
 # Third-party imports
 from pydantic import BaseModel, Field
@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Local imports (must be after sys.path modification)
 # ruff: noqa: E402
-from llm_utils import Messages, call_openrouter_structured
+from llm_utils import Messages, ParsedResponse, call_openrouter_structured
 
 
 class AnimalFact(BaseModel):
@@ -42,9 +42,6 @@ class AnimalInfo(BaseModel):
     )
 
 
-from typing import NamedTuple
-
-
 class AnimalInfoResponse(NamedTuple):
     """Class to hold both structured animal info and raw response."""
 
@@ -81,10 +78,6 @@ def get_animal_info(animal_name: str) -> Optional[AnimalInfoResponse]:
         # The response is a ParsedResponse when response_model is provided
         if hasattr(response, "parsed") and hasattr(response, "raw"):
             # Cast to ParsedResponse type to help the type checker
-            from typing import cast
-
-            from llm_utils import ParsedResponse
-
             parsed_response = cast(ParsedResponse[AnimalInfo], response)
 
             # Check if we received a refusal
@@ -131,9 +124,12 @@ def main():
             print(f"  • {habitat}")
 
         print("\nInteresting Facts:")
-        for i, fact in enumerate(animal_info.interesting_facts, 1):
-            print(f"  {i}. {fact.fact}")
-            print(f"     Source: {fact.source}")
+        fact_lines = [
+            f"  {i}. {fact.fact}\n     Source: {fact.source}"
+            for i, fact in enumerate(animal_info.interesting_facts, 1)
+        ]
+        if fact_lines:
+            print("\n".join(fact_lines))
 
         # Demonstrate programmatic access to the structured data
         print("\nDemonstrating programmatic access:")
@@ -146,13 +142,11 @@ def main():
         # Show raw response as well
         print("\n=== Raw LLM Response ===")
         # Print just the first 300 characters if it's very long
-        raw_preview = (
-            (response.raw_response[:300] + "...")
-            if len(response.raw_response) > 300
-            else response.raw_response
-        )
+        raw_response = response.raw_response
+        raw_length = len(raw_response)
+        raw_preview = raw_response[:300] + "..." if raw_length > 300 else raw_response
         print(raw_preview)
-        print(f"\nTotal raw response length: {len(response.raw_response)} characters")
+        print(f"\nTotal raw response length: {raw_length} characters")
     else:
         print("Failed to get structured information")
 
@@ -5,7 +5,7 @@ Test script for demonstrating structured output with Pydantic models.
 
 import os
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, cast
 
 # Third-party imports
 from pydantic import BaseModel, Field
@@ -16,8 +16,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Local imports (must be after sys.path modification)
 # ruff: noqa: E402
 from game_engine import GameEngine
-from llm_utils import Messages, call_openrouter_structured
+from llm_utils import Messages, ParsedResponse, call_openrouter_structured
 from map_generator import MapGenerator
+from unit_movement import get_game_state_description
 
 
 class Move(BaseModel):
@@ -42,49 +43,6 @@ class GameAnalysis(BaseModel):
     )
 
 
-def calculate_manhattan_distance(pos1, pos2):
-    """Calculate Manhattan distance between two positions."""
-    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-
-def get_game_state_description(game):
-    """Generate a text description of the current game state."""
-    map_render = game.render_map()
-
-    # Get unit positions
-    unit_positions = {}
-    for name, unit in game.units.items():
-        unit_positions[name] = unit.position
-
-    # Calculate distances to nearest coins
-    coin_distances = {}
-    for name, unit in game.units.items():
-        distances = [
-            calculate_manhattan_distance(unit.position, coin_pos)
-            for coin_pos in game.coin_positions
-        ]
-        nearest_distance = min(distances) if distances else -1
-        coin_distances[name] = nearest_distance
-
-    # Create game state description
-    state_description = f"""
-Current Game State:
-{map_render}
-
-Unit Positions:
-{", ".join([f"{name} at {pos}" for name, pos in unit_positions.items()])}
-
-Coins: {len(game.coin_positions)} remaining at {game.coin_positions}
-
-Turn: {game.current_turn}
-    """
-
-    return state_description, coin_distances
-
-
-from typing import NamedTuple
-
-
 class GameAnalysisResponse(NamedTuple):
     """Class to hold both structured game analysis and raw response."""
 
@@ -103,7 +61,7 @@ def get_structured_game_analysis(game) -> Optional[GameAnalysisResponse]:
         GameAnalysisResponse with both structured data and raw response,
         or None if there was an error
     """
-    state_description, coin_distances = get_game_state_description(game)
+    state_description = get_game_state_description(game)
 
     messages = Messages()
     messages.add_system_message(
@@ -128,10 +86,6 @@ def get_structured_game_analysis(game) -> Optional[GameAnalysisResponse]:
         # The response is a ParsedResponse when response_model is provided
         if hasattr(response, "parsed") and hasattr(response, "raw"):
             # Cast to ParsedResponse type to help the type checker
-            from typing import cast
-
-            from llm_utils import ParsedResponse
-
             parsed_response = cast(ParsedResponse[GameAnalysis], response)
 
             # Check if we received a refusal
@@ -193,13 +147,11 @@ def main():
         # Show raw response as well
         print("\n=== Raw LLM Response ===")
         # Print just the first 300 characters if it's very long
-        raw_preview = (
-            (response.raw_response[:300] + "...")
-            if len(response.raw_response) > 300
-            else response.raw_response
-        )
+        raw_response = response.raw_response
+        raw_length = len(raw_response)
+        raw_preview = raw_response[:300] + "..." if raw_length > 300 else raw_response
         print(raw_preview)
-        print(f"\nTotal raw response length: {len(response.raw_response)} characters")
+        print(f"\nTotal raw response length: {raw_length} characters")
     else:
         print("Failed to get structured analysis")
 
@@ -199,6 +199,44 @@ class TestGameEngine(unittest.TestCase):
         self.assertEqual(rendered_map[3][4], "c")  # Coin at (2,2)
         self.assertEqual(rendered_map[1][6], "c")  # Coin at (4,4)
 
+    def test_map_rendering_cache(self):
+        """Test that the cached map is redrawn after units move or coins are collected."""
+        custom_map = MapGenerator.generate_empty_map(5, 5)
+        game = GameEngine(map_grid=custom_map)
+        game.units["A"].position = (1, 1)
+        game.coin_positions = [(2, 1)]
+
+        first = game.render_map()
+        self.assertIs(game.render_map(), first)
+
+        # Moving onto the coin changes both the unit and the coin layer
+        self.assertTrue(game.move_unit("A", "right"))
+        rendered_map = game.render_map().split("\n")
+        self.assertEqual(rendered_map[4][4], "A")
+        self.assertNotIn("c", "".join(rendered_map))
+
+        # Direct position changes are picked up as well
+        game.units["A"].position = (0, 0)
+        self.assertEqual(game.render_map().split("\n")[5][2], "A")
+
+    def test_get_legal_moves(self):
+        """Test that legal moves exclude water and the map edges."""
+        custom_map = MapGenerator.generate_empty_map(5, 5)
+        custom_map[0][1] = TerrainType.WATER  # Water at (1,0)
+        game = GameEngine(map_grid=custom_map)
+
+        game.units["A"].position = (0, 0)
+        self.assertEqual(game.get_legal_moves("A"), ["up"])
+
+        game.units["A"].position = (2, 2)
+        self.assertEqual(game.get_legal_moves("A"), ["up", "down", "left", "right"])
+
+        # Every legal move is one that move_unit accepts
+        game.units["A"].position = (4, 0)
+        for direction in game.get_legal_moves("A"):
+            game.units["A"].position = (4, 0)
+            self.assertTrue(game.move_unit("A", direction))
+
     def test_player_unit_ownership(self):
         """Test that players can only move their own units."""
         custom_map = MapGenerator.generate_empty_map(5, 5)
@@ -230,6 +268,25 @@ class TestGameEngine(unittest.TestCase):
         self.assertEqual(unit_a.position, (2, 1))  # Moved right by player 1
         self.assertEqual(unit_b.position, (2, 3))  # Moved left by player 2
 
+    def test_find_random_land_positions(self):
+        """Test that random land positions are distinct, on land and not excluded."""
+        custom_map = MapGenerator.generate_empty_map(5, 5)
+        custom_map[2][2] = TerrainType.WATER
+        excluded = [(0, 0), (4, 4)]
+
+        positions = MapGenerator.find_random_land_positions(custom_map, 10, excluded)
+
+        self.assertEqual(len(positions), 10)
+        self.assertEqual(len(set(positions)), 10)
+        for x, y in positions:
+            self.assertEqual(custom_map[y][x], TerrainType.LAND)
+            self.assertNotIn((x, y), excluded)
+
+        # Asking for more positions than are free returns every free land position
+        positions = MapGenerator.find_random_land_positions(custom_map, 30, excluded)
+        self.assertEqual(len(positions), 22)
+        self.assertEqual(len(set(positions)), 22)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,11 +5,15 @@ from game_engine import GameEngine
 from llm_utils import ParsedResponse
 from map_generator import MapGenerator, TerrainType
 from unit_movement import (
+    AllUnitMoveDecisions,
     Direction,
     MoveDecision,
     MoveDecisionResponse,
+    UnitMoveDecision,
+    get_all_unit_move_decisions,
     get_game_state_description,
     get_unit_move_decision,
+    get_unit_surroundings,
 )
 
 
@@ -71,6 +75,19 @@ class TestLLMMovement(unittest.TestCase):
         # The map should show water at position (2,2)
         self.assertIn("~", description)
 
+    def test_unit_surroundings_closest_coin(self):
+        """Test that the closest coin's directions only mention the legs that are non-zero."""
+        self.game.coin_positions = [(3, 0)]
+        surroundings = get_unit_surroundings(self.game, "A")
+        self.assertIn("The closest coin is 3 steps away right (3 steps right).", surroundings)
+
+        self.game.coin_positions = [(1, 3)]
+        surroundings = get_unit_surroundings(self.game, "A")
+        self.assertIn(
+            "The closest coin is 4 steps away up-right (3 steps up and 1 step right).",
+            surroundings,
+        )
+
     @patch("unit_movement.call_openrouter_structured")
     def test_unit_move_decision(self, mock_call_openrouter_structured):
         """Test getting a move decision from the LLM (mocked)."""
@@ -116,6 +133,58 @@ class TestLLMMovement(unittest.TestCase):
             )
             self.assertEqual(response.raw_response, raw_response)
 
+    @patch("unit_movement.call_openrouter_structured")
+    def test_move_decision_prompt(self, mock_call_openrouter_structured):
+        """Test that the static terrain goes in the system prompt and not in each request."""
+        mock_call_openrouter_structured.side_effect = Exception("API error")
+        get_unit_move_decision(self.game, "A")
+
+        _, kwargs = mock_call_openrouter_structured.call_args
+        system_message, state_message, unit_message = kwargs["messages"].messages
+        self.assertIn("Map terrain", system_message["content"])
+        self.assertIn("~", system_message["content"])
+        self.assertNotIn("Current Game State:", state_message["content"])
+        self.assertIn("A at (0, 0)", state_message["content"])
+
+        # The per-unit message comes last so the shared prefix is the same for every unit
+        self.assertIn("controlling unit A", unit_message["content"])
+        get_unit_move_decision(self.game, "B")
+        _, kwargs = mock_call_openrouter_structured.call_args
+        self.assertEqual(kwargs["messages"].messages[:2], [system_message, state_message])
+
+        # Without the map the state description has no terrain in it
+        self.assertNotIn("~", get_game_state_description(self.game, include_map=False))
+
+    @patch("unit_movement.call_openrouter_structured")
+    def test_forced_moves_skip_llm(self, mock_call_openrouter_structured):
+        """Test that units with at most one legal move are decided without an LLM call."""
+        # Water at (1,0) leaves unit A at (0,0) only able to move up. Terrain is cached when
+        # the engine is built, so set up the map first and build a fresh game from it.
+        test_map = MapGenerator.generate_empty_map(5, 5)
+        test_map[2][2] = TerrainType.WATER
+        test_map[0][1] = TerrainType.WATER
+        self.game = GameEngine(map_grid=test_map, num_coins=3)
+        self.game.units["A"].position = (0, 0)
+        self.game.units["B"].position = (4, 4)
+        self.game.coin_positions = [(4, 0), (0, 4)]
+
+        response = get_unit_move_decision(self.game, "A")
+        mock_call_openrouter_structured.assert_not_called()
+        assert response is not None  # Help type checker
+        self.assertEqual(response.decision.direction, "up")
+        self.assertEqual(response.raw_response, "")
+
+        # In the batched call only unit B is sent to the LLM
+        mock_call_openrouter_structured.side_effect = Exception("API error")
+        decisions = get_all_unit_move_decisions(self.game)
+        _, kwargs = mock_call_openrouter_structured.call_args
+        system_message = kwargs["messages"].messages[0]["content"]
+        prompt = kwargs["messages"].messages[-1]["content"]
+        self.assertIn("\n0 .~...", system_message)
+        self.assertNotIn("Unit A at position", prompt)
+        self.assertIn("Unit B at position (4, 4). It can move: down, left.", prompt)
+        self.assertEqual(list(decisions), ["A"])
+
     @patch("unit_movement.call_openrouter_structured")
     def test_error_handling(self, mock_call_openrouter_structured):
         """Test error handling when the LLM call fails."""
@@ -128,6 +197,42 @@ class TestLLMMovement(unittest.TestCase):
         # Check that we handled the error
         self.assertIsNone(response)
 
+    @patch("unit_movement.call_openrouter_structured")
+    def test_all_unit_move_decisions(self, mock_call_openrouter_structured):
+        """Test getting every unit's move from a single LLM call (mocked)."""
+        moves = AllUnitMoveDecisions(
+            moves=[
+                UnitMoveDecision(unit="A", direction=Direction.RIGHT, reasoning="Coin at (1,0)"),
+                UnitMoveDecision(unit="Z", direction=Direction.UP, reasoning="Not a real unit"),
+            ]
+        )
+        raw_response = moves.model_dump_json()
+        mock_call_openrouter_structured.return_value = ParsedResponse(
+            parsed=moves, raw=raw_response
+        )
+
+        decisions = get_all_unit_move_decisions(self.game)
+
+        # One request covers both units
+        mock_call_openrouter_structured.assert_called_once()
+        _, kwargs = mock_call_openrouter_structured.call_args
+        self.assertEqual(kwargs["response_model"], AllUnitMoveDecisions)
+
+        # The unit is named first, so the model says who a move is for before reasoning
+        self.assertEqual(
+            list(UnitMoveDecision.model_json_schema()["properties"]),
+            ["unit", "reasoning", "direction"],
+        )
+
+        # Unknown units are dropped and units without an answer are left out
+        self.assertEqual(list(decisions), ["A"])
+        self.assertEqual(decisions["A"].decision.direction, "right")
+        self.assertEqual(decisions["A"].raw_response, raw_response)
+
+        # Errors give no decisions rather than raising
+        mock_call_openrouter_structured.side_effect = Exception("API error")
+        self.assertEqual(get_all_unit_move_decisions(self.game), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from io import StringIO
+
+from message_handler import ChatHistory, ChatMessage
+
+
+class TestChatHistory(unittest.TestCase):
+    def setUp(self):
+        """Set up a chat history with one message of each kind."""
+        self.history = ChatHistory()
+        self.history.add_player_message("hello")
+        self.history.add_unit_message("A", "moving out")
+        self.history.add_move_message("A moved up")
+
+    def test_format_chat_history(self):
+        """Test that each sender type gets the right prefix."""
+        formatted = self.history.format_chat_history().split("\n")
+
+        self.assertEqual(len(formatted), 4)
+        self.assertTrue(formatted[0].startswith("SYSTEM: Welcome"))
+        self.assertEqual(formatted[1], "YOU: hello")
+        self.assertEqual(formatted[2], "UNIT A: moving out")
+        self.assertEqual(formatted[3], "MOVE: A moved up")
+
+    def test_format_chat_history_max_messages(self):
+        """Test that only the newest messages are formatted."""
+        formatted = self.history.format_chat_history(max_messages=2)
+
+        self.assertEqual(formatted, "UNIT A: moving out\nMOVE: A moved up")
+
+    def test_format_chat_history_buffer(self):
+        """Test that formatted lines are streamed into a buffer."""
+        buffer = StringIO()
+        formatted = self.history.format_chat_history(max_messages=2, buffer=buffer)
+
+        self.assertEqual(buffer.getvalue(), formatted + "\n")
+
+    def test_add_legacy_tuple(self):
+        """Test that legacy (sender, content) tuples are stored as ChatMessage objects."""
+        self.history.add_message(("B", "on my way"))
+        self.history.add_message(("system", "game over"))
+
+        last_two = self.history.get_last_n_messages(2)
+        self.assertIsInstance(last_two[0], ChatMessage)
+        self.assertEqual(last_two[0].sender_type, "unit")
+        self.assertEqual(last_two[1].sender_type, "system")
+        self.assertEqual(
+            self.history.format_chat_history(max_messages=2),
+            "UNIT B: on my way\nSYSTEM: game over",
+        )
+
+    def test_format_chat_history_cache(self):
+        """Test that cached output is reused until a new message is added."""
+        first = self.history.format_chat_history(max_messages=2)
+        self.assertIs(self.history.format_chat_history(max_messages=2), first)
+
+        self.history.add_system_message("turn over")
+        self.assertEqual(
+            self.history.format_chat_history(max_messages=2),
+            "MOVE: A moved up\nSYSTEM: turn over",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -86,6 +86,15 @@ class TestPlayerController(unittest.TestCase):
         # Should return False
         self.assertFalse(result)
 
+    def test_direction_keys(self):
+        """Test that vim keys and upper-case keys map to the same directions as wasd."""
+        self.assertTrue(self.controller.process_input("AK"))
+        self.assertEqual(self.game.units["A"].position, (1, 2))
+        self.assertTrue(self.controller.process_input("aJ"))
+        self.assertEqual(self.game.units["A"].position, (1, 1))
+        self.assertTrue(self.controller.process_input("AD"))
+        self.assertEqual(self.game.units["A"].position, (2, 1))
+
     @patch("builtins.print")
     def test_invalid_format(self, mock_print):
         """Test input with invalid format."""
@@ -116,6 +125,33 @@ class TestPlayerController(unittest.TestCase):
         self.assertEqual(self.game.units["A"].position, (0, 2))
         self.assertEqual(len(self.game.coin_positions), 0)
 
+    def test_toggle_mode(self):
+        """Test that toggling the mode switches which handler processes input."""
+        with self.assertLogs("player_controller", level="INFO") as logs:
+            self.controller.toggle_mode()
+        self.assertEqual(
+            logs.output, ["INFO:player_controller:Switched to natural language input mode."]
+        )
+        self.assertFalse(self.controller.manual_mode)
+
+        # "Aw" is now treated as a chat message and does not move the unit
+        self.assertTrue(self.controller.process_input("Aw"))
+        self.assertEqual(self.game.units["A"].position, (1, 1))
+        self.assertIn("YOU: Aw", self.controller.get_chat_history())
+
+        self.controller.toggle_mode()
+        self.assertTrue(self.controller.process_input("Aw"))
+        self.assertEqual(self.game.units["A"].position, (1, 2))
+
+    def test_chat_history_lines(self):
+        """Test that chat history lines match the joined chat history."""
+        self.controller.process_input("Aw")
+        self.controller.process_input("Bd")
+
+        lines = self.controller.get_chat_history_lines(max_messages=2)
+        self.assertEqual(list(lines), ["MOVE: A moved up", "MOVE: B moved right"])
+        self.assertEqual("\n".join(lines), self.controller.get_chat_history(max_messages=2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,11 @@
 from enum import Enum
-from typing import NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional, cast
 
 from pydantic import BaseModel, Field
 
 from game_engine import GameEngine
-from llm_utils import Messages, call_openrouter_structured
-from map_generator import TerrainType
+from llm_utils import Messages, ParsedResponse, call_openrouter_structured
+from map_generator import MapGenerator, TerrainType
 
 
 class Direction(str, Enum):
@@ -27,6 +27,24 @@ class MoveDecision(BaseModel):
     )
 
 
+class UnitMoveDecision(BaseModel):
+    """Model representing a move decision for one named unit."""
+
+    # Fields are generated in this order, so the unit is named before the model reasons
+    unit: str = Field(..., description="Name of the unit to move")
+    reasoning: str = Field(..., description="Reasoning behind this move decision")
+    direction: Direction = Field(
+        ...,
+        description="Direction to move: 'up', 'down', 'left', or 'right'",
+    )
+
+
+class AllUnitMoveDecisions(BaseModel):
+    """Model representing the move decisions for every unit in one turn."""
+
+    moves: List[UnitMoveDecision] = Field(..., description="One move decision per unit")
+
+
 class MoveDecisionResponse(NamedTuple):
     """Class to hold both structured move decision and raw response."""
 
@@ -34,6 +52,40 @@ class MoveDecisionResponse(NamedTuple):
     raw_response: str
 
 
+# System prompts for a single unit and for all units at once; they never change per call
+UNIT_SYSTEM_PROMPT = (
+    "You are an AI controlling a unit in the GPT Generals game. "
+    "Your goal is to collect coins on the map. "
+    "The game is played on a grid where units can move in four directions "
+    "(up, down, left, right). "
+    "Water tiles (~) cannot be traversed. "
+    "You will receive natural language descriptions of your surroundings "
+    "to help you understand where coins, water, and other units are relative to your position."
+)
+ALL_UNITS_SYSTEM_PROMPT = (
+    "You are an AI controlling the units in the GPT Generals game. "
+    "Your goal is to collect coins on the map. "
+    "The game is played on a grid where units can move in four directions "
+    "(up, down, left, right). "
+    "Water tiles (~) cannot be traversed. "
+    "You will receive natural language descriptions of each unit's surroundings "
+    "to help you understand where coins, water, and other units are relative to it."
+)
+
+# (dx, dy, distance) for every tile within 3 steps, nearest first, ties in row-major order
+_NEARBY_OFFSETS = tuple(
+    sorted(
+        (
+            (dx, dy, abs(dx) + abs(dy))
+            for dy in range(-3, 4)
+            for dx in range(-3, 4)
+            if abs(dx) + abs(dy) <= 3
+        ),
+        key=lambda offset: (offset[2], offset[1], offset[0]),
+    )
+)
+
+
 def calculate_manhattan_distance(pos1: tuple[int, int], pos2: tuple[int, int]) -> int:
     """Calculate Manhattan distance between two positions."""
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
@@ -88,16 +140,19 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
     unit_position = game.units[unit_name].position
     surroundings = []
 
-    # Find nearby coins (all coins sorted by distance)
+    # Sort coins by distance, then describe only the (at most four) that are mentioned
+    unit_x, unit_y = unit_position
+    sorted_coins = sorted(
+        game.coin_positions,
+        key=lambda coin_pos: abs(coin_pos[0] - unit_x) + abs(coin_pos[1] - unit_y),
+    )
+    num_coins = len(sorted_coins)
     nearby_coins = []
-    for coin_pos in game.coin_positions:
+    for coin_pos in sorted_coins[:4]:
         distance = calculate_manhattan_distance(unit_position, coin_pos)
         direction, x_dist, y_dist = get_relative_direction(unit_position, coin_pos)
         nearby_coins.append((coin_pos, distance, direction, x_dist, y_dist))
 
-    # Sort coins by distance
-    nearby_coins.sort(key=lambda x: x[1])
-
     # Describe coins
     if nearby_coins:
         # Describe closest coin with detailed directions
@@ -106,18 +161,20 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
         if distance == 1:
             surroundings.append(f"There's a coin right {direction} from you.")
         else:
+            # Spell out the vertical and horizontal legs, leaving out any that are zero
+            y_word = "up" if "up" in direction else "down"
+            x_word = "left" if "left" in direction else "right"
+            legs = []
+            if y_dist:
+                legs.append(f"{y_dist} {'step' if y_dist == 1 else 'steps'} {y_word}")
+            if x_dist:
+                legs.append(f"{x_dist} {'step' if x_dist == 1 else 'steps'} {x_word}")
             surroundings.append(
-                f"The closest coin is {distance} steps away {direction} "
-                f"({y_dist} {('step' if y_dist == 1 else 'steps')} "
-                f"{'up' if 'up' in direction else 'down' if 'down' in direction else ''}"
-                f"{' and ' if 'up' in direction or 'down' in direction else ''}"
-                f"{x_dist} {('step' if x_dist == 1 else 'steps')} "
-                f"{'left' if 'left' in direction else 'right' if 'right' in direction else ''}"
-                f")."
+                f"The closest coin is {distance} steps away {direction} ({' and '.join(legs)})."
             )
 
         # Mention other coins
-        if len(nearby_coins) > 1:
+        if num_coins > 1:
             other_coins_text = []
             # Limit to 3 more coins
             for _i, (_coin_pos, distance, direction, _x_dist, _y_dist) in enumerate(
@@ -126,7 +183,7 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
                 other_coins_text.append(f"another coin {distance} steps away {direction}")
 
             if other_coins_text:
-                more_coins = len(nearby_coins) - 4 if len(nearby_coins) > 4 else 0
+                more_coins = num_coins - 4 if num_coins > 4 else 0
                 coins_desc = ", ".join(other_coins_text)
                 if more_coins > 0:
                     coins_desc += f", and {more_coins} more farther away"
@@ -134,27 +191,23 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
     else:
         surroundings.append("There are no coins on the map.")
 
-    # Find nearby water obstacles (within 3 steps)
+    # Find the nearest water obstacles (within 3 steps), walking outwards by distance so
+    # the scan can stop as soon as three have been found
     water_tiles = []
-    for y in range(max(0, unit_position[1] - 3), min(len(game.map_grid), unit_position[1] + 4)):
-        x_range = range(
-            max(0, unit_position[0] - 3), min(len(game.map_grid[0]), unit_position[0] + 4)
-        )
-        for x in x_range:
-            if game.map_grid[y][x] == TerrainType.WATER:
-                pos = (x, y)
-                distance = calculate_manhattan_distance(unit_position, pos)
-                if distance <= 3:  # Only consider water within 3 steps
-                    direction, x_dist, y_dist = get_relative_direction(unit_position, pos)
-                    water_tiles.append((pos, distance, direction))
-
-    # Sort water by distance
-    water_tiles.sort(key=lambda x: x[1])
+    map_grid, width, height = game.map_grid, game.width, game.height
+    for dx, dy, distance in _NEARBY_OFFSETS:
+        x = unit_position[0] + dx
+        y = unit_position[1] + dy
+        if 0 <= x < width and 0 <= y < height and map_grid[y][x] == TerrainType.WATER:
+            direction, _x_dist, _y_dist = get_relative_direction(unit_position, (x, y))
+            water_tiles.append(((x, y), distance, direction))
+            if len(water_tiles) == 3:
+                break
 
     # Describe water obstacles
     if water_tiles:
         water_directions = []
-        for _pos, distance, direction in water_tiles[:3]:  # Limit to 3 water tiles
+        for _pos, distance, direction in water_tiles:
             water_directions.append(f"{direction} ({distance} step{'s' if distance > 1 else ''})")
 
         water_desc = ", ".join(water_directions)
@@ -177,11 +230,11 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
     borders = []
     if unit_position[0] == 0:
         borders.append("western")
-    if unit_position[0] == len(game.map_grid[0]) - 1:
+    if unit_position[0] == game.width - 1:
         borders.append("eastern")
     if unit_position[1] == 0:
         borders.append("northern")
-    if unit_position[1] == len(game.map_grid) - 1:
+    if unit_position[1] == game.height - 1:
         borders.append("southern")
 
     if borders:
@@ -191,32 +244,32 @@ def get_unit_surroundings(game: GameEngine, unit_name: str) -> str:
     return "\n".join(surroundings)
 
 
-def get_game_state_description(game: GameEngine) -> str:
-    """Generate a text description of the current game state."""
-    map_render = game.render_map()
+def get_terrain_description(game: GameEngine) -> str:
+    """Generate a text description of the map terrain, which never changes during a game."""
+    terrain_render = MapGenerator.render_map(game.map_grid, terrain_rows=game.terrain_rows)
+    return (
+        "Map terrain ('.' is land, '~' is water; row numbers are y, with up being +y, "
+        f"and column numbers are x):\n{terrain_render}"
+    )
 
-    # Get unit positions
-    unit_positions = {}
-    for name, unit in game.units.items():
-        unit_positions[name] = unit.position
 
-    # Calculate distances to nearest coins
-    coin_distances = {}
-    for name, unit in game.units.items():
-        distances = [
-            calculate_manhattan_distance(unit.position, coin_pos)
-            for coin_pos in game.coin_positions
-        ]
-        nearest_distance = min(distances) if distances else -1
-        coin_distances[name] = nearest_distance
+def get_game_state_description(game: GameEngine, include_map: bool = True) -> str:
+    """
+    Generate a text description of the current game state.
 
-    # Create game state description
-    state_description = f"""
-Current Game State:
-{map_render}
+    Args:
+        game: GameEngine instance with the current game state
+        include_map: Whether to include the rendered map (default True)
+
+    Returns:
+        The game state description
+    """
+    map_section = f"\nCurrent Game State:\n{game.render_map()}\n" if include_map else ""
 
+    # Create game state description
+    state_description = f"""{map_section}
 Unit Positions:
-{", ".join([f"{name} at {pos}" for name, pos in unit_positions.items()])}
+{", ".join([f"{name} at {unit.position}" for name, unit in game.units.items()])}
 
 Coins: {len(game.coin_positions)} remaining at {game.coin_positions}
 
@@ -226,43 +279,71 @@ Turn: {game.current_turn}
     return state_description
 
 
+def get_forced_move_decision(legal_moves: List[str]) -> Optional[MoveDecisionResponse]:
+    """
+    Decide a unit's move locally when it has at most one legal move.
+
+    Args:
+        legal_moves: The directions the unit can currently move in
+
+    Returns:
+        MoveDecisionResponse with an empty raw response, or None if the unit has a real
+        choice and the LLM should be asked
+    """
+    if len(legal_moves) > 1:
+        return None
+
+    if legal_moves:
+        decision = MoveDecision(
+            direction=Direction(legal_moves[0]), reasoning="This is the only move available."
+        )
+    else:
+        decision = MoveDecision(
+            direction=Direction.UP, reasoning="No move is available, so the unit stays put."
+        )
+    return MoveDecisionResponse(decision=decision, raw_response="")
+
+
 def get_unit_move_decision(game: GameEngine, unit_name: str) -> Optional[MoveDecisionResponse]:
     """
-    Get a structured move decision from the LLM for a specific unit.
+    Get a structured move decision for a specific unit.
+
+    A unit with at most one legal move is decided locally without calling the LLM.
 
     Args:
         game: GameEngine instance with the current game state
         unit_name: Name of the unit to get a move decision for
 
     Returns:
-        MoveDecisionResponse with both structured decision and raw response,
-        or None if there was an error
+        MoveDecisionResponse with both structured decision and raw response (empty for a
+        locally decided move), or None if there was an error
     """
-    state_description = get_game_state_description(game)
+    # Skip the LLM call entirely when the unit has no real choice
+    legal_moves = game.get_legal_moves(unit_name)
+    forced_decision = get_forced_move_decision(legal_moves)
+    if forced_decision is not None:
+        return forced_decision
+
+    state_description = get_game_state_description(game, include_map=False)
     unit_position = game.units[unit_name].position
 
     # Get intuitive description of the unit's surroundings
     surroundings_description = get_unit_surroundings(game, unit_name)
 
     messages = Messages()
-    messages.add_system_message(
-        "You are an AI controlling a unit in the GPT Generals game. "
-        "Your goal is to collect coins on the map. "
-        "The game is played on a grid where units can move in four directions "
-        "(up, down, left, right). "
-        "Water tiles (~) cannot be traversed. "
-        "You will receive natural language descriptions of your surroundings "
-        "to help you understand where coins, water, and other units are relative to your position."
-    )
+    messages.add_system_message(f"{UNIT_SYSTEM_PROMPT}\n\n{get_terrain_description(game)}")
 
+    # The game state is the same for every unit this turn, so send it ahead of the
+    # unit-specific message to keep the shared prompt prefix identical between calls
+    messages.add_user_message(f"Game State (for reference):\n{state_description}")
     messages.add_user_message(
         f"You are controlling unit {unit_name} at position {unit_position}. "
         f"Choose a direction to move (up, down, left, or right) to collect coins efficiently.\n\n"
         f"Your surroundings:\n{surroundings_description}\n\n"
+        f"You can move: {', '.join(legal_moves)}.\n\n"
         f"You must respond with a JSON object containing two fields:\n"
         f"- direction: one of 'up', 'down', 'left', or 'right'\n"
-        f"- reasoning: a brief explanation of why you chose this direction\n\n"
-        f"Game State (for reference):\n{state_description}"
+        f"- reasoning: a brief explanation of why you chose this direction"
     )
 
     try:
@@ -276,10 +357,6 @@ def get_unit_move_decision(game: GameEngine, unit_name: str) -> Optional[MoveDec
         # The response is a ParsedResponse when response_model is provided
         if hasattr(response, "parsed") and hasattr(response, "raw"):
             # Cast to ParsedResponse type to help the type checker
-            from typing import cast
-
-            from llm_utils import ParsedResponse
-
             parsed_response = cast(ParsedResponse[MoveDecision], response)
 
             # Check if we received a refusal
@@ -298,3 +375,77 @@ def get_unit_move_decision(game: GameEngine, unit_name: str) -> Optional[MoveDec
     except Exception as e:
         print(f"Error getting move decision from LLM: {e}")
         return None
+
+
+def get_all_unit_move_decisions(game: GameEngine) -> Dict[str, MoveDecisionResponse]:
+    """
+    Get structured move decisions for every unit from a single LLM call.
+
+    Args:
+        game: GameEngine instance with the current game state
+
+    Returns:
+        Dict mapping unit names to their MoveDecisionResponse. Units with at most one legal
+        move are decided locally; units the model did not answer for are missing, as are
+        all undecided units if there was an error.
+    """
+    decisions: Dict[str, MoveDecisionResponse] = {}
+    unit_descriptions = []
+    for unit_name, unit in game.units.items():
+        legal_moves = game.get_legal_moves(unit_name)
+        forced_decision = get_forced_move_decision(legal_moves)
+        if forced_decision is not None:
+            decisions[unit_name] = forced_decision
+            continue
+
+        surroundings_description = get_unit_surroundings(game, unit_name)
+        unit_descriptions.append(
+            f"Unit {unit_name} at position {unit.position}. "
+            f"It can move: {', '.join(legal_moves)}. "
+            f"Its surroundings:\n{surroundings_description}"
+        )
+
+    # Every unit was forced or trapped, so there is nothing to ask the LLM
+    if not unit_descriptions:
+        return decisions
+
+    state_description = get_game_state_description(game, include_map=False)
+
+    messages = Messages()
+    messages.add_system_message(f"{ALL_UNITS_SYSTEM_PROMPT}\n\n{get_terrain_description(game)}")
+
+    units_text = "\n\n".join(unit_descriptions)
+    messages.add_user_message(
+        f"Choose a direction to move (up, down, left, or right) for each of these units "
+        f"to collect coins efficiently.\n\n"
+        f"{units_text}\n\n"
+        f"You must respond with a JSON object containing a 'moves' list with one entry "
+        f"per unit, each with three fields:\n"
+        f"- unit: the name of the unit\n"
+        f"- reasoning: a brief explanation of why you chose this direction\n"
+        f"- direction: one of 'up', 'down', 'left', or 'right'\n\n"
+        f"Game State (for reference):\n{state_description}"
+    )
+
+    try:
+        parsed_response = call_openrouter_structured(
+            messages=messages,
+            response_model=AllUnitMoveDecisions,
+            model="openai/gpt-4o-mini",
+        )
+
+        if parsed_response.refusal:
+            print(f"Model refused to respond: {parsed_response.refusal}")
+            return decisions
+
+        assert parsed_response.parsed is not None  # Help type checker
+        for move in parsed_response.parsed.moves:
+            if move.unit in game.units and move.unit not in decisions:
+                decision = MoveDecision(reasoning=move.reasoning, direction=move.direction)
+                decisions[move.unit] = MoveDecisionResponse(
+                    decision=decision, raw_response=parsed_response.raw
+                )
+        return decisions
+    except Exception as e:
+        print(f"Error getting move decisions from LLM: {e}")
+        return decisions